@@ -0,0 +1,12 @@
+# The part of artifetch's recording format that other tools need in order to
+# write recordings that artifetch can replay (see artifetch-bench). Both
+# scripts import it from the directory they live in.
+
+import hashlib
+import json
+
+
+def request_hash(params):
+    """Return the name of the requests/ entry for a request key."""
+    canonical = json.dumps(params, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()